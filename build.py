@@ -57,7 +57,7 @@ def build():
         # Hidden imports - Others
         "--hidden-import=requests",
         "--hidden-import=bs4",
-        "--hidden-import=pyperclip",
+        "--hidden-import=lxml",
         "--hidden-import=tqdm",
         # Collect all packages
         "--collect-all=customtkinter",
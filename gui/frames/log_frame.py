@@ -4,6 +4,7 @@
 
 import customtkinter as ctk
 from datetime import datetime
+from typing import List, Tuple
 
 
 class LogFrame(ctk.CTkFrame):
@@ -50,23 +51,39 @@ class LogFrame(ctk.CTkFrame):
 
     def add_log(self, message: str, level: str = "info"):
         """로그 추가"""
+        self.add_log_batch([(message, level)])
+
+    def add_log_batch(self, items: List[Tuple[str, str]]):
+        """
+        로그 여러 개를 한 번에 추가 (텍스트박스 갱신 1회)
+
+        Args:
+            items: (메시지, 레벨) 리스트
+        """
+        if not items:
+            return
+
         timestamp = datetime.now().strftime("%H:%M:%S")
+        log_lines = "".join(
+            f"[{timestamp}] {self._level_prefix(level)} {message}\n"
+            for message, level in items
+        )
 
-        # 레벨에 따른 prefix
-        level_prefix = {
+        self.log_textbox.configure(state="normal")
+        self.log_textbox.insert("end", log_lines)
+        self.log_textbox.see("end")
+        self.log_textbox.configure(state="disabled")
+
+    @staticmethod
+    def _level_prefix(level: str) -> str:
+        """레벨에 따른 prefix"""
+        return {
             "info": "[INFO]",
             "warning": "[WARN]",
             "error": "[ERROR]",
             "success": "[SUCCESS]"
         }.get(level, "[INFO]")
 
-        log_line = f"[{timestamp}] {level_prefix} {message}\n"
-
-        self.log_textbox.configure(state="normal")
-        self.log_textbox.insert("end", log_line)
-        self.log_textbox.see("end")
-        self.log_textbox.configure(state="disabled")
-
     def clear_log(self):
         """로그 지우기"""
         self.log_textbox.configure(state="normal")
@@ -5,6 +5,7 @@ NaverBlogPoster - 네이버 블로그 자동 포스팅 앱
 
 import sys
 import os
+import multiprocessing
 
 # 실행 파일 경로 설정 (PyInstaller 호환)
 if getattr(sys, 'frozen', False):
@@ -25,4 +26,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 프로세스 풀(spawn) 자식 프로세스 지원
+    multiprocessing.freeze_support()
     main()
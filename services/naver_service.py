@@ -4,10 +4,42 @@
 
 import os
 import time
-import pyperclip
-from typing import Optional, List, Callable
+import hashlib
+from functools import lru_cache
+from typing import Optional, List, Callable, Tuple
 from dataclasses import dataclass
 
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import (
+        StaleElementReferenceException,
+        TimeoutException,
+    )
+except ImportError:
+    # 패키지 누락 시 _init_driver에서 NaverServiceError로 안내
+    By = Keys = ActionChains = WebDriverWait = EC = None
+    StaleElementReferenceException = TimeoutException = None
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """
+    ChromeDriver 경로 (프로세스 내 최초 1회만 확인)
+
+    CHROMEDRIVER 환경변수가 있으면 webdriver-manager 없이 그 경로를 사용
+    """
+    path = os.environ.get("CHROMEDRIVER")
+    if path:
+        return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
 
 @dataclass
 class PostResult:
@@ -24,49 +56,186 @@ class NaverService:
     BLOG_WRITE_URL = "https://blog.naver.com/{blog_id}?Redirect=Write"
 
     DEFAULT_TIMEOUT = 10
-    PAGE_LOAD_WAIT = 3
-    EDITOR_LOAD_WAIT = 5
+    EDITOR_LOAD_TIMEOUT = 15
+    PUBLISH_TIMEOUT = 15
+    LOGIN_STATE_TTL = 30  # 로그인 상태 캐시 유효 시간 (초)
+    LOGIN_COOKIES = ("NID_AUT", "NID_SES")
+
+    # 쿠키/캐시를 유지하는 Chrome 프로필 경로 (재시작 시 로그인 생략)
+    # 계정별 하위 폴더를 사용하므로 다른 ID의 로그인 세션을 재사용하지 않음
+    DEFAULT_PROFILE_ROOT = os.path.join("~", ".cache", "postingbot", "chrome_profiles")
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    # 새 문서마다 실행되는 자동화 흔적 제거 스크립트
+    STEALTH_SCRIPT = (
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+        "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});"
+        "Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});"
+    )
+
+    # 페이지 로드 시 차단할 불필요한 리소스 (광고/트래커/웹폰트)
+    BLOCKED_URL_PATTERNS = [
+        "*google-analytics*",
+        "*googletagmanager*",
+        "*doubleclick*",
+        "*adcr.naver.com*",
+        "*siape.veta.naver.com*",
+        "*.woff2",
+        "*/pixel*",
+    ]
+
+    # 선택자 순서대로 일치하는 요소 목록 (중복 제외) - _find_first에서 사용
+    FIND_IN_ORDER_SCRIPT = (
+        "const seen = new Set(), found = [];"
+        "for (const selector of arguments[0]) {"
+        "  for (const el of document.querySelectorAll(selector)) {"
+        "    if (!seen.has(el)) { seen.add(el); found.push(el); }"
+        "  }"
+        "}"
+        "return found;"
+    )
+
+    # 에디터 요소 CSS 선택자 (우선순위 순)
+    TITLE_SELECTORS = (
+        "div[data-a11y-title='제목'] p.se-text-paragraph",
+        "div.se-documentTitle p.se-text-paragraph",
+    )
+    CONTENT_SELECTORS = (
+        "div[data-a11y-title='본문'] p.se-text-paragraph",
+        "div.se-component.se-text p.se-text-paragraph",
+    )
+    TAG_INPUT_SELECTORS = (
+        "input#tag-input",
+        "input[placeholder*='태그']",
+    )
+    PUBLISH_SELECTORS = (
+        "button[data-click-area='tpb.publish']",
+        "button[class*='publish_btn']",
+        "button.publish_btn__m9KHH",
+    )
+    CONFIRM_SELECTORS = (
+        "button[data-testid='seOnePublishBtn']",
+        "button[class*='confirm_btn']",
+        "button.confirm_btn__WEaBq",
+    )
+
+    CHROME_ARGUMENTS = (
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-blink-features=AutomationControlled",
+        "--window-size=1920,1080",
+    )
+
+    CHROME_PREFS = {
+        "profile.default_content_setting_values.notifications": 2,
+    }
+
+    # light_mode에서 추가로 끄는 기능 (미사용 백그라운드 기능)
+    # 이미지 로딩은 에디터 이미지 업로드/미리보기와 캡차 확인에 필요하므로 유지
+    LIGHT_ARGUMENTS = (
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--mute-audio",
+        "--disable-renderer-backgrounding",
+    )
 
     def __init__(
         self,
         headless: bool = False,
         logger: Optional[Callable] = None,
-        blog_id: Optional[str] = None
+        blog_id: Optional[str] = None,
+        light_mode: bool = True,
+        user_data_dir: Optional[str] = None
     ):
+        """
+        Args:
+            user_data_dir: Chrome 프로필 경로. 지정하지 않으면 login() 시
+                계정별 프로필(DEFAULT_PROFILE_ROOT 하위)로 브라우저를 시작
+        """
         self.headless = headless
+        self.light_mode = light_mode
         self.logger = logger or print
         self.driver = None
         self.blog_id = blog_id
-        self._init_driver()
+        # blog_id를 지정하지 않았으면 로그인한 ID를 따라감
+        self._blog_id_from_login = blog_id is None
+        # (확인 시각, 로그인 여부) - _is_logged_in 결과 캐시
+        self._login_state: Optional[Tuple[float, bool]] = None
+
+        # 지정한 프로필은 바로 시작, 아니면 계정을 알게 되는 login()에서 시작
+        self._custom_profile = user_data_dir is not None
+        self.user_data_dir = os.path.expanduser(user_data_dir) if user_data_dir else None
+        # 현재 브라우저가 사용하는 계정 프로필 키
+        self._profile_key: Optional[str] = None
+        if self._custom_profile:
+            self._init_driver()
+
+    @classmethod
+    def _build_options(cls, headless: bool, light_mode: bool = True):
+        """Chrome 옵션 구성 (공통 설정 + 인스턴스별 headless/light_mode 여부)"""
+        from selenium.webdriver.chrome.options import Options
+
+        options = Options()
+        if headless:
+            options.add_argument("--headless=new")
+
+        arguments = cls.CHROME_ARGUMENTS
+        if light_mode:
+            arguments += cls.LIGHT_ARGUMENTS
+
+        for argument in arguments:
+            options.add_argument(argument)
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_experimental_option("prefs", dict(cls.CHROME_PREFS))
+        # DOMContentLoaded 시점에 get() 반환
+        options.page_load_strategy = "eager"
+        return options
 
     def _init_driver(self):
         """Selenium WebDriver 초기화"""
         try:
             from selenium import webdriver
             from selenium.webdriver.chrome.service import Service
-            from selenium.webdriver.chrome.options import Options
-            from webdriver_manager.chrome import ChromeDriverManager
-
-            options = Options()
-            if self.headless:
-                options.add_argument("--headless=new")
-
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument(
-                "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
 
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            options = self._build_options(self.headless, self.light_mode)
+            if self.user_data_dir:
+                os.makedirs(self.user_data_dir, exist_ok=True)
+                options.add_argument(f"--user-data-dir={self.user_data_dir}")
+
+            try:
+                self.driver = webdriver.Chrome(
+                    service=Service(_chromedriver_path()), options=options
+                )
+            except Exception as e:
+                if not self.user_data_dir:
+                    raise
+                # 다른 Chrome이 같은 프로필을 사용 중이면 임시 프로필로 실행 (세션 재사용 불가)
+                self.logger(f"Chrome 프로필을 사용할 수 없어 임시 프로필로 실행: {e}")
+                self.user_data_dir = None
+                self.driver = webdriver.Chrome(
+                    service=Service(_chromedriver_path()),
+                    options=self._build_options(self.headless, self.light_mode)
+                )
+            # 요소 탐색은 명시적 대기만 사용 (find_elements 즉시 반환)
+            self.driver.implicitly_wait(0)
+            self.driver.execute_cdp_cmd(
+                "Network.setUserAgentOverride",
+                {"userAgent": self.USER_AGENT, "acceptLanguage": "ko-KR,ko;q=0.9"}
+            )
             self.driver.execute_cdp_cmd(
                 "Page.addScriptToEvaluateOnNewDocument",
-                {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
+                {"source": self.STEALTH_SCRIPT}
+            )
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS}
             )
             self.logger("Chrome 브라우저 초기화 완료")
 
@@ -77,40 +246,40 @@ class NaverService:
 
     def login(self, user_id: str, password: str) -> bool:
         """네이버 로그인"""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-
         self.logger("네이버 로그인 시도 중...")
-        if not self.blog_id:
+        if self._blog_id_from_login:
             self.blog_id = user_id
 
         try:
+            self._ensure_driver(user_id)
             self.driver.get(self.NAVER_LOGIN_URL)
-            time.sleep(self.PAGE_LOAD_WAIT)
 
-            # ID 입력
-            id_input = WebDriverWait(self.driver, self.DEFAULT_TIMEOUT).until(
-                EC.presence_of_element_located((By.ID, "id"))
-            )
-            pyperclip.copy(user_id)
-            id_input.click()
-            id_input.send_keys(Keys.CONTROL, 'v')
-            time.sleep(0.5)
+            # 이 계정의 프로필에 로그인 세션이 유효하면 ID/PW 입력 생략
+            self._invalidate_login_state()
+            if self._has_login_cookie():
+                self._login_state = (time.monotonic(), True)
+                self.logger("기존 로그인 세션 사용")
+                return True
+
+            # ID 입력 (입력란이 나타나면 나머지 리소스 로딩 중단)
+            id_input = self._wait(EC.presence_of_element_located((By.ID, "id")))
+            self._stop_loading()
+            self._fill_input(id_input, user_id)
 
             # PW 입력
             pw_input = self.driver.find_element(By.ID, "pw")
-            pyperclip.copy(password)
-            pw_input.click()
-            pw_input.send_keys(Keys.CONTROL, 'v')
-            time.sleep(0.5)
+            self._fill_input(pw_input, password)
 
-            # 로그인 버튼 클릭
-            self.driver.find_element(By.ID, "log.login").click()
-            time.sleep(self.PAGE_LOAD_WAIT)
+            # 로그인 버튼 클릭 후 페이지 이동 대기
+            login_btn = self.driver.find_element(By.ID, "log.login")
+            login_btn.click()
+            try:
+                self._wait(EC.staleness_of(login_btn))
+            except TimeoutException:
+                pass
 
             # 로그인 확인
+            self._invalidate_login_state()
             if self._is_logged_in():
                 self.logger("로그인 성공")
                 return True
@@ -122,16 +291,76 @@ class NaverService:
         except Exception as e:
             raise NaverServiceError(f"로그인 중 오류: {e}")
 
+    def _ensure_driver(self, user_id: str):
+        """
+        계정별 Chrome 프로필로 브라우저 준비
+
+        다른 계정으로 로그인하면 브라우저를 해당 계정 프로필로 다시 시작
+        """
+        if self._custom_profile:
+            if self.driver is None:
+                self._init_driver()
+            return
+
+        # ID를 그대로 경로에 쓰지 않도록 해시 사용
+        profile_key = hashlib.sha256(user_id.encode("utf-8")).hexdigest()[:16]
+        if self.driver is not None and self._profile_key == profile_key:
+            return
+
+        if self.driver is not None:
+            self.close()
+
+        self.user_data_dir = os.path.join(
+            os.path.expanduser(self.DEFAULT_PROFILE_ROOT), profile_key
+        )
+        self._profile_key = profile_key
+        self._init_driver()
+
+    def _fill_input(self, element, text: str):
+        """
+        입력란에 텍스트 입력
+
+        OS 클립보드를 거치지 않고 CDP Input.insertText로 브라우저 레벨
+        입력 이벤트를 발생시킴. CDP를 쓸 수 없으면 send_keys로 대체
+        """
+        element.click()
+
+        try:
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+        except Exception:
+            element.send_keys(text)
+
     def _is_logged_in(self) -> bool:
-        """로그인 상태 확인"""
+        """로그인 상태 확인 (LOGIN_STATE_TTL 동안 결과 재사용)"""
+        if self._login_state:
+            checked_at, logged_in = self._login_state
+            if time.monotonic() - checked_at < self.LOGIN_STATE_TTL:
+                return logged_in
+
+        logged_in = self._check_login_state()
+        self._login_state = (time.monotonic(), logged_in)
+        return logged_in
+
+    def _check_login_state(self) -> bool:
+        """브라우저에서 로그인 상태 조회"""
         try:
             if "nidlogin" in self.driver.current_url:
                 return False
-            cookies = self.driver.get_cookies()
-            cookie_names = [c['name'] for c in cookies]
-            return 'NID_AUT' in cookie_names or 'NID_SES' in cookie_names
         except Exception:
             return False
+        return self._has_login_cookie()
+
+    def _has_login_cookie(self) -> bool:
+        """네이버 로그인 쿠키 존재 여부"""
+        try:
+            # 필요한 쿠키만 개별 조회 (전체 쿠키 직렬화 방지)
+            return any(self.driver.get_cookie(name) for name in self.LOGIN_COOKIES)
+        except Exception:
+            return False
+
+    def _invalidate_login_state(self):
+        """로그인 상태 캐시 무효화"""
+        self._login_state = None
 
     def create_post(
         self,
@@ -141,35 +370,34 @@ class NaverService:
         images: Optional[List[str]] = None
     ) -> PostResult:
         """블로그 포스트 작성"""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-
         self.logger("블로그 포스트 작성 중...")
 
         try:
             if not self.blog_id:
                 raise NaverServiceError("블로그 ID가 없습니다.")
+            if self.driver is None:
+                raise NaverServiceError("로그인이 필요합니다.")
 
             # 글쓰기 페이지로 이동
             write_url = self.BLOG_WRITE_URL.format(blog_id=self.blog_id)
             self.logger(f"글쓰기 페이지 이동: {write_url}")
             self.driver.get(write_url)
-            time.sleep(self.PAGE_LOAD_WAIT)
 
-            # iframe 전환
+            # iframe 전환 (mainFrame이 준비될 때까지 대기)
             self._switch_to_editor()
 
             # ★ 핵심: 제목을 먼저 입력! (순서 변경)
             self._input_title(title)
-            time.sleep(1)
-            
+
             # 본문 입력
             self._input_content(content)
-            time.sleep(1)
 
-            # 발행
-            post_url = self._publish_post()
+            # 이미지 업로드는 에디터 파일 입력 동작이 검증되지 않아 미지원
+            if images:
+                self.logger(f"이미지 {len(images)}개는 업로드하지 않습니다 (미지원 기능)")
+
+            # 발행 (태그는 발행 설정 레이어에서 입력)
+            post_url = self._publish_post(tags)
             self.logger(f"포스팅 완료: {post_url}")
 
             return PostResult(success=True, post_url=post_url)
@@ -179,62 +407,118 @@ class NaverService:
 
     def _switch_to_editor(self):
         """에디터 iframe으로 전환"""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-
         self.driver.switch_to.default_content()
-        time.sleep(0.5)
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.frame_to_be_available_and_switch_to_it((By.ID, "mainFrame"))
-            )
+            self._wait(EC.frame_to_be_available_and_switch_to_it((By.ID, "mainFrame")))
             self.logger("mainFrame iframe 전환 완료")
         except Exception as e:
             self.logger(f"mainFrame 전환 실패: {e}")
 
-        time.sleep(self.EDITOR_LOAD_WAIT)
+        # 에디터 스크립트가 초기화되어 제목 입력란이 생길 때까지 대기
+        try:
+            self._wait(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ", ".join(self.TITLE_SELECTORS))
+                ),
+                timeout=self.EDITOR_LOAD_TIMEOUT
+            )
+        except TimeoutException:
+            self.logger("에디터 로딩 대기 시간 초과")
 
-    def _input_title(self, title: str):
+        self._stop_loading()
+
+    def _wait(self, condition, timeout: Optional[float] = None):
+        """조건이 충족될 때까지 대기 (시간 초과 시 TimeoutException)"""
+        return WebDriverWait(self.driver, timeout or self.DEFAULT_TIMEOUT).until(condition)
+
+    def _stop_loading(self):
+        """필요한 요소가 준비된 뒤 남은 페이지 리소스 로딩 중단"""
+        try:
+            self.driver.execute_script("window.stop();")
+        except Exception:
+            pass
+
+    def _find_first(
+        self,
+        selectors: Tuple[str, ...],
+        timeout: float,
+        clickable: bool = False
+    ):
+        """
+        여러 CSS 선택자 중 화면에 표시된 요소 찾기 (앞의 선택자 우선)
+
+        폴링마다 스크립트 한 번으로 선택자 순서대로 요소를 모아 확인함
+        (하나의 선택자 그룹으로 합치면 문서 순서가 되어 우선순위가 사라짐).
+        못 찾으면 None 반환
+        """
+        def probe(driver):
+            for elem in driver.execute_script(self.FIND_IN_ORDER_SCRIPT, list(selectors)):
+                if elem.is_displayed() and (not clickable or elem.is_enabled()):
+                    return elem
+            return None
+
+        try:
+            return WebDriverWait(
+                self.driver, timeout,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(probe)
+        except TimeoutException:
+            return None
+
+    def _insert_text(self, text: str):
         """
-        제목 입력 - 클릭 후 키보드 입력 (에디터 인식 가능하도록)
+        포커스된 요소에 텍스트 입력
+
+        CDP Input.insertText는 IME 확정과 같은 input 이벤트를 발생시키므로
+        한 줄을 한 번의 호출로 입력. 줄바꿈은 Enter 키로 단락을 나누고,
+        CDP 호출이 실패하면 ActionChains 키 입력으로 대체
         """
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.common.action_chains import ActionChains
+        for i, line in enumerate(text.split("\n")):
+            if i:
+                ActionChains(self.driver).send_keys(Keys.ENTER).perform()
+            if not line:
+                continue
+            try:
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": line})
+            except Exception:
+                ActionChains(self.driver).send_keys(line).perform()
 
+    def _paste_via_script(self, element, text: str) -> bool:
+        """
+        execute_script 한 번으로 전체 텍스트 입력
+
+        붙여넣기와 같은 beforeinput 이벤트를 먼저 보내고, 에디터가 직접
+        처리하지 않으면 execCommand('insertText')로 삽입. 실패 시 False
+        """
+        try:
+            return bool(self.driver.execute_script("""
+                const p = arguments[0];
+                const txt = arguments[1];
+                p.focus();
+                const dt = new DataTransfer();
+                dt.setData('text/plain', txt);
+                const handled = !p.dispatchEvent(new InputEvent('beforeinput', {
+                    inputType: 'insertFromPaste', data: txt, dataTransfer: dt,
+                    bubbles: true, cancelable: true
+                }));
+                return handled || document.execCommand('insertText', false, txt);
+            """, element, text))
+        except Exception:
+            return False
+
+    def _input_title(self, title: str):
+        """
+        제목 입력 - 클릭 후 CDP 텍스트 입력 (에디터 인식 가능하도록)
+        """
         try:
             self.logger("제목 입력 시작...")
             
             # 페이지 맨 위로 스크롤
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
 
-            # 제목 영역 찾기
-            title_elem = None
-            
-            # 방법 1: data-a11y-title="제목" 내의 p 태그
-            try:
-                title_div = self.driver.find_element(
-                    By.CSS_SELECTOR, "div[data-a11y-title='제목']"
-                )
-                title_elem = title_div.find_element(
-                    By.CSS_SELECTOR, "p.se-text-paragraph"
-                )
-                self.logger("제목 요소 발견: data-a11y-title='제목'")
-            except Exception:
-                pass
-
-            # 방법 2: se-documentTitle 클래스
-            if not title_elem:
-                try:
-                    title_elem = self.driver.find_element(
-                        By.CSS_SELECTOR, "div.se-documentTitle p.se-text-paragraph"
-                    )
-                    self.logger("제목 요소 발견: se-documentTitle")
-                except Exception:
-                    pass
+            # 제목 영역 찾기 (data-a11y-title="제목" > se-documentTitle 순)
+            title_elem = self._find_first(self.TITLE_SELECTORS, timeout=self.DEFAULT_TIMEOUT)
 
             if not title_elem:
                 raise NaverServiceError("제목 입력란을 찾을 수 없습니다")
@@ -243,20 +527,17 @@ class NaverService:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'});", title_elem
             )
-            time.sleep(0.5)
 
             # ★ 핵심: 제목 영역 클릭하여 포커스
-            title_elem.click()
-            time.sleep(0.5)
+            self._wait(EC.element_to_be_clickable(title_elem)).click()
             
             # 기존 텍스트 전체 선택 후 삭제
             actions = ActionChains(self.driver)
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
-            time.sleep(0.2)
+            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)
+            actions.send_keys(Keys.DELETE).perform()
             
-            # ★ 핵심: send_keys로 직접 타이핑 (에디터가 인식함)
-            actions = ActionChains(self.driver)
-            actions.send_keys(title).perform()
+            # ★ 핵심: CDP로 한 번에 입력 (에디터가 input 이벤트로 인식함)
+            self._insert_text(title)
             time.sleep(0.5)
 
             self.logger(f"제목 입력 완료: {title}")
@@ -268,12 +549,8 @@ class NaverService:
 
     def _input_content(self, content: str):
         """
-        본문 입력 - 본문 영역을 정확히 클릭 후 키보드 입력
+        본문 입력 - 본문 영역을 정확히 클릭 후 CDP 텍스트 입력
         """
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.common.action_chains import ActionChains
-
         try:
             self.logger("본문 입력 시작...")
             
@@ -282,29 +559,8 @@ class NaverService:
             actions.send_keys(Keys.ESCAPE).perform()
             time.sleep(0.5)
 
-            content_elem = None
-
-            # 방법 1: data-a11y-title="본문" 속성으로 정확히 특정
-            try:
-                content_div = self.driver.find_element(
-                    By.CSS_SELECTOR, "div[data-a11y-title='본문']"
-                )
-                content_elem = content_div.find_element(
-                    By.CSS_SELECTOR, "p.se-text-paragraph"
-                )
-                self.logger("본문 요소 발견: data-a11y-title='본문'")
-            except Exception:
-                pass
-
-            # 방법 2: se-component se-text 클래스
-            if not content_elem:
-                try:
-                    content_elem = self.driver.find_element(
-                        By.CSS_SELECTOR, "div.se-component.se-text p.se-text-paragraph"
-                    )
-                    self.logger("본문 요소 발견: se-component.se-text")
-                except Exception:
-                    pass
+            # 본문 영역 찾기 (data-a11y-title="본문" > se-component.se-text 순)
+            content_elem = self._find_first(self.CONTENT_SELECTORS, timeout=self.DEFAULT_TIMEOUT)
 
             if not content_elem:
                 raise NaverServiceError("본문 입력란을 찾을 수 없습니다")
@@ -313,20 +569,18 @@ class NaverService:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'});", content_elem
             )
-            time.sleep(0.5)
 
             # ★ 핵심: 본문 영역 클릭하여 포커스 이동
-            content_elem.click()
-            time.sleep(0.5)
+            self._wait(EC.element_to_be_clickable(content_elem)).click()
             
             # 기존 텍스트 전체 선택 후 삭제 (placeholder 제거)
             actions = ActionChains(self.driver)
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
-            time.sleep(0.2)
+            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)
+            actions.send_keys(Keys.DELETE).perform()
             
-            # ★ 핵심: send_keys로 직접 타이핑
-            actions = ActionChains(self.driver)
-            actions.send_keys(content).perform()
+            # ★ 핵심: 스크립트 한 번으로 입력 (거부되면 CDP 줄 단위 입력)
+            if not self._paste_via_script(content_elem, content):
+                self._insert_text(content)
             time.sleep(0.5)
 
             self.logger("본문 입력 완료")
@@ -336,62 +590,76 @@ class NaverService:
         except Exception as e:
             raise NaverServiceError(f"본문 입력 실패: {e}")
 
-    def _publish_post(self) -> Optional[str]:
-        """포스트 발행"""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
+    def _input_tags(self, tags: List[str]):
+        """
+        태그 입력 - 발행 설정 레이어의 태그 입력란에 한 번의 스크립트로 입력
+
+        React 제어 입력란이 값을 인식하도록 네이티브 value setter를 사용하고
+        태그마다 input/Enter 이벤트를 발생시킴
+        """
+        tag_input = self._find_first(self.TAG_INPUT_SELECTORS, timeout=3)
+
+        if not tag_input:
+            self.logger("태그 입력란을 찾을 수 없습니다")
+            return
+
+        try:
+            self.driver.execute_script("""
+                const el = arguments[0];
+                const tags = arguments[1];
+                const setter = Object.getOwnPropertyDescriptor(
+                    HTMLInputElement.prototype, 'value').set;
+                for (const t of tags) {
+                    setter.call(el, t);
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', bubbles: true}));
+                    el.dispatchEvent(new KeyboardEvent('keyup', {key: 'Enter', bubbles: true}));
+                }
+            """, tag_input, tags[:10])
+            self.logger(f"태그 입력 완료: {', '.join(tags[:10])}")
+        except Exception as e:
+            self.logger(f"태그 입력 실패: {e}")
 
+    def _publish_post(self, tags: Optional[List[str]] = None) -> Optional[str]:
+        """포스트 발행"""
         try:
             self.logger("발행 버튼 찾는 중...")
 
-            # 발행 버튼 선택자들
-            selectors = [
-                "button[data-click-area='tpb.publish']",
-                "button[class*='publish_btn']",
-                "button.publish_btn__m9KHH",
-            ]
-
-            publish_btn = None
-            for selector in selectors:
-                try:
-                    publish_btn = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    if publish_btn:
-                        self.logger(f"발행 버튼 발견: {selector}")
-                        break
-                except Exception:
-                    continue
+            # 발행 버튼 찾기
+            publish_btn = self._find_first(self.PUBLISH_SELECTORS, timeout=5, clickable=True)
 
             if not publish_btn:
                 raise NaverServiceError("발행 버튼을 찾을 수 없습니다")
 
             # 발행 버튼 클릭
+            before_url = self.driver.current_url
             self.driver.execute_script("arguments[0].click();", publish_btn)
             self.logger("발행 버튼 클릭")
-            time.sleep(3)
-
-            # 두 번째 발행 확인 버튼 찾기
-            confirm_selectors = [
-                "button[data-testid='seOnePublishBtn']",
-                "button[class*='confirm_btn']",
-                "button.confirm_btn__WEaBq",
-            ]
-
-            for selector in confirm_selectors:
-                try:
-                    confirm_btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+
+            # 발행 설정 레이어의 확인 버튼이 클릭 가능해질 때까지 대기
+            confirm_btn = self._find_first(
+                self.CONFIRM_SELECTORS, timeout=self.DEFAULT_TIMEOUT, clickable=True
+            )
+
+            if tags:
+                self._input_tags(tags)
+
+            if confirm_btn:
+                self.driver.execute_script("arguments[0].click();", confirm_btn)
+                self.logger("발행 확인 버튼 클릭")
+
+            # 글 보기 페이지로 이동할 때까지 대기 (시간 초과 시 짧게 추가 대기)
+            try:
+                WebDriverWait(self.driver, self.PUBLISH_TIMEOUT).until(
+                    lambda d: d.current_url != before_url and (
+                        "PostView" in d.current_url
+                        or "logNo" in d.current_url
+                        or "Redirect=Write" not in d.current_url
                     )
-                    if confirm_btn:
-                        self.driver.execute_script("arguments[0].click();", confirm_btn)
-                        self.logger("발행 확인 버튼 클릭")
-                        break
-                except Exception:
-                    continue
-
-            time.sleep(5)
+                )
+            except TimeoutException:
+                time.sleep(2)
+
             self.driver.switch_to.default_content()
             return self.driver.current_url
 
@@ -402,12 +670,14 @@ class NaverService:
 
     def close(self):
         """브라우저 종료"""
+        self._invalidate_login_state()
         if self.driver:
             try:
                 self.driver.quit()
                 self.logger("브라우저 종료")
             except Exception:
                 pass
+            self.driver = None
 
     def __enter__(self):
         return self
@@ -14,11 +14,18 @@ Pollinations.ai 이미지 생성 서비스 (무료)
 """
 
 import os
+import re
+import asyncio
 import time
+import shutil
 import hashlib
+import tempfile
+import threading
 import requests
-from typing import Optional, Callable
-from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Optional, Callable, List, Tuple
+from urllib.parse import quote, urlencode
 from dataclasses import dataclass
 
 
@@ -41,23 +48,69 @@ class PollinationsService:
     DEFAULT_WIDTH = 1024
     DEFAULT_HEIGHT = 768
     DEFAULT_MODEL = "flux"  # flux, turbo 등
+    MAX_WORKERS = 8  # 동시 요청 상한 (HTTP 연결 풀 크기와 동일)
+
+    # 간단한 주제-영어 매핑 (실제로는 번역 API 사용 권장)
+    TOPIC_MAP = {
+        "맛집": "delicious food restaurant",
+        "여행": "beautiful travel destination",
+        "카페": "cozy cafe interior",
+        "요리": "home cooking food",
+        "운동": "fitness exercise",
+        "독서": "reading books",
+        "음악": "music instruments",
+        "영화": "cinema movie",
+        "패션": "fashion style",
+        "뷰티": "beauty cosmetics",
+        "육아": "parenting family",
+        "반려동물": "cute pets",
+        "자기계발": "personal development growth",
+        "재테크": "financial investment money",
+        "IT": "technology digital",
+        "건강": "health wellness",
+    }
+
+    # 긴 키워드 우선 매칭
+    _TOPIC_RE = re.compile(
+        "|".join(map(re.escape, sorted(TOPIC_MAP, key=len, reverse=True)))
+    )
 
     def __init__(
         self,
         save_dir: str = "data/images",
-        logger: Optional[Callable] = None
+        logger: Optional[Callable] = None,
+        allow_cache: bool = True
     ):
         """
         Args:
             save_dir: 이미지 저장 디렉토리
             logger: 로그 출력 함수
+            allow_cache: seed를 지정한 동일 요청의 캐시 결과 사용 허용
+                (seed 미지정 요청은 항상 새로 생성)
         """
         self.save_dir = save_dir
         self.logger = logger or print
+        self.allow_cache = allow_cache
+
+        # keep-alive 연결 재사용 (요청마다 TCP/TLS 핸드셰이크 방지)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.MAX_WORKERS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
         # 저장 디렉토리 생성
         os.makedirs(save_dir, exist_ok=True)
 
+        # 첫 요청 전에 DNS 조회/TLS 연결을 미리 맺어둠
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """연결 풀 예열 (실패해도 무시)"""
+        try:
+            self._session.head(self.BASE_URL, timeout=5)
+        except Exception:
+            pass
+
     def generate_image(
         self,
         prompt: str,
@@ -85,48 +138,26 @@ class PollinationsService:
         Returns:
             ImageResult 객체
         """
-        # 프롬프트 URL 인코딩
-        encoded_prompt = quote(prompt)
-
-        # URL 파라미터 구성
-        params = [
-            f"width={width}",
-            f"height={height}",
-            f"model={model}",
-        ]
-
-        if seed is not None:
-            params.append(f"seed={seed}")
-        if enhance:
-            params.append("enhance=true")
-        if nologo:
-            params.append("nologo=true")
-
-        # 캐시 방지를 위한 타임스탬프
-        params.append(f"t={int(time.time())}")
+        url, filepath, cache_path = self._prepare_request(
+            prompt, filename, width, height, model, seed, enhance, nologo
+        )
 
-        url = f"{self.BASE_URL}/{encoded_prompt}?{'&'.join(params)}"
+        if cache_path:
+            cached = self._cached_result(cache_path, filepath, url, prompt, width, height)
+            if cached:
+                return cached
 
         self.logger(f"이미지 생성 중: {prompt[:50]}...")
 
         try:
-            # 이미지 요청
-            response = requests.get(url, timeout=120)
-            response.raise_for_status()
-
-            # 파일명 생성
-            if not filename:
-                prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
-                filename = f"image_{prompt_hash}_{int(time.time())}.png"
-
-            # 확장자 확인
-            if not filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                filename += '.png'
+            # 이미지 요청 (본문은 스트리밍으로 수신)
+            with self._session.get(url, timeout=120, stream=True) as response:
+                response.raise_for_status()
 
-            # 파일 저장
-            filepath = os.path.join(self.save_dir, filename)
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+                # 캐시 대상이면 캐시 파일로 저장 후 요청한 파일명으로 연결
+                self._save_stream(response, cache_path or filepath)
+            if cache_path:
+                self._link_or_copy(cache_path, filepath)
 
             self.logger(f"이미지 저장 완료: {filepath}")
 
@@ -145,6 +176,249 @@ class PollinationsService:
         except IOError as e:
             raise PollinationsServiceError(f"이미지 저장 실패: {e}")
 
+    def _prepare_request(
+        self,
+        prompt: str,
+        filename: Optional[str],
+        width: int,
+        height: int,
+        model: str,
+        seed: Optional[int],
+        enhance: bool,
+        nologo: bool
+    ) -> Tuple[str, str, Optional[str]]:
+        """요청 URL, 저장 경로, 캐시 경로 구성 (캐시 대상이 아니면 캐시 경로는 None)"""
+        # 프롬프트 URL 인코딩
+        encoded_prompt = quote(prompt)
+
+        # URL 파라미터 구성
+        params = {"width": width, "height": height, "model": model}
+
+        if seed is not None:
+            params["seed"] = seed
+        if enhance:
+            params["enhance"] = "true"
+        if nologo:
+            params["nologo"] = "true"
+
+        # 캐시 방지를 위한 타임스탬프 (seed 미지정 시 매번 새 이미지)
+        if seed is None:
+            params["t"] = int(time.time())
+
+        url = f"{self.BASE_URL}/{encoded_prompt}?{urlencode(params, quote_via=quote)}"
+
+        # 파일명 생성
+        if not filename:
+            prompt_hash = hashlib.blake2b(prompt.encode("utf-8"), digest_size=4).hexdigest()
+            filename = f"image_{prompt_hash}_{int(time.time())}.png"
+
+        # 확장자 확인
+        if not filename.lower().endswith(('.png', '.jpg', '.jpeg')):
+            filename += '.png'
+
+        filepath = os.path.join(self.save_dir, filename)
+
+        # 동일 조건으로 생성한 이미지 캐시 경로
+        # (seed를 지정해야 같은 결과가 나오므로 seed 미지정 요청은 캐시하지 않음)
+        cache_path = None
+        if seed is not None and self.allow_cache:
+            cache_key = hashlib.sha256(
+                f"{model}|{width}|{height}|{seed}|{enhance}|{nologo}|{prompt}".encode("utf-8")
+            ).hexdigest()
+            cache_path = os.path.join(self.save_dir, f"cache_{cache_key}.png")
+
+        return url, filepath, cache_path
+
+    def _cached_result(
+        self,
+        cache_path: str,
+        filepath: str,
+        url: str,
+        prompt: str,
+        width: int,
+        height: int
+    ) -> Optional[ImageResult]:
+        """동일 조건으로 생성한 이미지가 있으면 재사용"""
+        try:
+            if os.path.isfile(cache_path) and os.path.getsize(cache_path) > 0:
+                self._link_or_copy(cache_path, filepath)
+                self.logger(f"캐시된 이미지 사용: {filepath}")
+                return ImageResult(
+                    path=filepath,
+                    url=url,
+                    prompt=prompt,
+                    width=width,
+                    height=height
+                )
+        except OSError:
+            pass
+        return None
+
+    def _save_stream(self, response: requests.Response, filepath: str):
+        """
+        응답 본문을 청크 단위로 저장
+
+        임시 파일에 기록한 뒤 os.replace로 교체하므로
+        다운로드 도중 실패해도 잘린 파일이 남지 않음
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.save_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str):
+        """캐시 파일을 대상 경로에 하드링크 (지원되지 않으면 복사)"""
+        if os.path.abspath(src) == os.path.abspath(dst):
+            return
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    def generate_images_batch(self, jobs: List[dict]) -> List[ImageResult]:
+        """
+        여러 이미지 동시 생성
+
+        각 작업은 네트워크 대기 위주이므로 스레드로 병렬 요청하여
+        전체 소요 시간을 단축 (동시 요청은 MAX_WORKERS개로 제한)
+
+        Args:
+            jobs: generate_image 키워드 인자 딕셔너리 리스트
+
+        Returns:
+            ImageResult 리스트 (jobs 순서 유지)
+        """
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(jobs), self.MAX_WORKERS)) as executor:
+            futures = [executor.submit(self.generate_image, **job) for job in jobs]
+            return [future.result() for future in futures]
+
+    async def agenerate_image(
+        self,
+        prompt: str,
+        filename: Optional[str] = None,
+        width: int = DEFAULT_WIDTH,
+        height: int = DEFAULT_HEIGHT,
+        model: str = DEFAULT_MODEL,
+        seed: Optional[int] = None,
+        enhance: bool = True,
+        nologo: bool = True,
+        session=None
+    ) -> ImageResult:
+        """
+        이미지 생성 (비동기, aiohttp 필요)
+
+        인자와 캐시 동작은 generate_image와 동일
+
+        Args:
+            session: 공유할 aiohttp.ClientSession (없으면 이 호출에서 생성 후 종료)
+
+        Returns:
+            ImageResult 객체
+        """
+        aiohttp = self._import_aiohttp()
+
+        if session is None:
+            async with self._create_async_session(aiohttp) as own_session:
+                return await self.agenerate_image(
+                    prompt, filename, width, height, model, seed, enhance, nologo,
+                    session=own_session
+                )
+
+        url, filepath, cache_path = self._prepare_request(
+            prompt, filename, width, height, model, seed, enhance, nologo
+        )
+
+        if cache_path:
+            cached = self._cached_result(cache_path, filepath, url, prompt, width, height)
+            if cached:
+                return cached
+
+        self.logger(f"이미지 생성 중: {prompt[:50]}...")
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.save_dir, suffix=".part")
+
+        try:
+            with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+                async with session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=120)
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(65536):
+                        f.write(chunk)
+            os.replace(tmp_path, cache_path or filepath)
+            if cache_path:
+                self._link_or_copy(cache_path, filepath)
+
+        except asyncio.TimeoutError:
+            raise PollinationsServiceError("이미지 생성 시간 초과 (120초)")
+        except aiohttp.ClientError as e:
+            raise PollinationsServiceError(f"이미지 다운로드 실패: {e}")
+        except IOError as e:
+            raise PollinationsServiceError(f"이미지 저장 실패: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        self.logger(f"이미지 저장 완료: {filepath}")
+
+        return ImageResult(
+            path=filepath,
+            url=url,
+            prompt=prompt,
+            width=width,
+            height=height
+        )
+
+    async def agenerate_batch(self, prompts: List[str], **kwargs) -> List[ImageResult]:
+        """
+        여러 프롬프트 이미지를 하나의 이벤트 루프에서 동시 생성
+
+        Args:
+            prompts: 프롬프트 리스트
+            **kwargs: agenerate_image 공통 인자
+
+        Returns:
+            ImageResult 리스트 (prompts 순서 유지)
+        """
+        aiohttp = self._import_aiohttp()
+
+        # 배치 전체가 세션 하나(연결 풀)를 공유하고 끝나면 종료
+        async with self._create_async_session(aiohttp) as session:
+            return list(await asyncio.gather(
+                *[self.agenerate_image(prompt, session=session, **kwargs) for prompt in prompts]
+            ))
+
+    @staticmethod
+    def _import_aiohttp():
+        """aiohttp 지연 import"""
+        try:
+            import aiohttp
+        except ImportError:
+            raise PollinationsServiceError("aiohttp 패키지가 필요합니다.")
+        return aiohttp
+
+    @staticmethod
+    def _create_async_session(aiohttp):
+        """동시 연결 수를 제한한 aiohttp 세션"""
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16))
+
     def generate_blog_header(
         self,
         topic: str,
@@ -204,32 +478,9 @@ class PollinationsService:
         Returns:
             ImageResult 객체
         """
-        # 간단한 주제-영어 매핑 (실제로는 번역 API 사용 권장)
-        topic_map = {
-            "맛집": "delicious food restaurant",
-            "여행": "beautiful travel destination",
-            "카페": "cozy cafe interior",
-            "요리": "home cooking food",
-            "운동": "fitness exercise",
-            "독서": "reading books",
-            "음악": "music instruments",
-            "영화": "cinema movie",
-            "패션": "fashion style",
-            "뷰티": "beauty cosmetics",
-            "육아": "parenting family",
-            "반려동물": "cute pets",
-            "자기계발": "personal development growth",
-            "재테크": "financial investment money",
-            "IT": "technology digital",
-            "건강": "health wellness",
-        }
-
-        # 매핑된 주제 찾기
-        english_topic = korean_topic
-        for kr, en in topic_map.items():
-            if kr in korean_topic:
-                english_topic = en
-                break
+        # 매핑된 주제 찾기 (정규식 한 번으로 탐색)
+        match = self._TOPIC_RE.search(korean_topic)
+        english_topic = self.TOPIC_MAP[match.group(0)] if match else korean_topic
 
         prompt = f"{english_topic}, {additional_style}, modern blog image, professional quality, no text"
         return self.generate_image(prompt=prompt)
@@ -243,7 +494,7 @@ class PollinationsService:
         """
         try:
             test_url = f"{self.BASE_URL}/test?width=64&height=64"
-            response = requests.head(test_url, timeout=10)
+            response = self._session.head(test_url, timeout=10, stream=True)
             return response.status_code == 200
         except Exception:
             return False
@@ -262,22 +513,35 @@ class PollinationsService:
         Returns:
             삭제된 파일 수
         """
-        import glob
-
         deleted = 0
         cutoff_time = time.time() - (older_than_days * 24 * 60 * 60)
 
-        for filepath in glob.glob(os.path.join(self.save_dir, "image_*.png")):
-            if os.path.getmtime(filepath) < cutoff_time:
+        # scandir 항목의 stat 정보를 사용해 파일당 stat 호출 1회로 처리
+        with os.scandir(self.save_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(("image_", "cache_")) or not name.endswith(".png"):
+                    continue
                 try:
-                    os.remove(filepath)
-                    deleted += 1
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        deleted += 1
                 except OSError:
                     pass
 
         self.logger(f"캐시 정리 완료: {deleted}개 파일 삭제")
         return deleted
 
+    def close(self):
+        """HTTP 세션 종료"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
 
 class PollinationsServiceError(Exception):
     """Pollinations 서비스 예외"""
@@ -337,7 +601,6 @@ if __name__ == "__main__":
         # 테스트 후 정리 여부 확인
         cleanup = input("\n테스트 이미지를 삭제할까요? (y/N): ").strip().lower()
         if cleanup == 'y':
-            import shutil
             shutil.rmtree(test_dir, ignore_errors=True)
             print("테스트 이미지 삭제 완료")
 
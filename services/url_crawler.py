@@ -10,13 +10,179 @@ URL 크롤링 서비스 - 웹 페이지 내용 추출
     print(result.content)
 """
 
+import io
+import os
+import html
+import json
+import codecs
+import time
+import asyncio
+import threading
+import multiprocessing
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional, Callable, List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound
+from typing import Optional, Callable, List, Dict, Tuple, Iterable, Iterator
 from dataclasses import dataclass
-from urllib.parse import urlparse
+from urllib.parse import urlsplit, urlunsplit
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON 파서 (orjson이 있으면 사용)
+_json_loads = orjson.loads if orjson else json.loads
+
+
+# URL 유효성 검사 (http/https + 호스트)
+_RE_URL = re.compile(r'^https?://[^/\s?#]+', re.I)
+
+# 텍스트 정리용 정규식
+_RE_HSPACE = re.compile(r'[ \t]+')
+_RE_SENT = re.compile(r'[.!?]\s+')
+
+# 파싱 전에 제거할 블록의 시작 (script/style/noscript, 아이콘 svg, template/iframe, 주석)
+_RE_JUNK_OPEN = re.compile(
+    rb'<(script|style|noscript|svg|template|iframe)(?=[\s/>])|<!--',
+    re.I
+)
+
+# 문서 앞부분의 meta charset 선언 (<meta charset>, http-equiv 모두)
+_RE_META_CHARSET = re.compile(rb'<meta\s[^>]*charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+# JSON-LD 구조화 데이터 블록
+_RE_JSON_LD = re.compile(
+    rb'<script[^>]*\btype\s*=\s*["\']?application/ld\+json[^>]*>(.*?)</script\s*>',
+    re.I | re.S
+)
+
+
+def _strip_junk_blocks(markup: bytes) -> bytes:
+    """
+    script/style 등 불필요한 블록과 주석을 제거
+
+    닫는 태그는 여는 태그 끝에서부터 bytes.find로 찾고, 닫히지 않은 블록은
+    그대로 둠 (같은 태그는 한 번 실패하면 다시 찾지 않으므로 문서 길이에 선형)
+    """
+    lower = markup.lower()
+    parts = []
+    cursor = 0
+    unclosed = set()  # 이후 위치에 닫는 태그가 없는 이름
+
+    for match in _RE_JUNK_OPEN.finditer(lower):
+        start = match.start()
+        if start < cursor:
+            continue
+
+        name = match.group(1)
+        if name is None:
+            # 주석
+            if b'-->' in unclosed:
+                continue
+            close = lower.find(b'-->', match.end())
+            if close < 0:
+                unclosed.add(b'-->')
+                continue
+            end = close + 3
+        else:
+            if name in unclosed:
+                continue
+            tag_end = lower.find(b'>', match.end())
+            if tag_end < 0:
+                break
+            if lower[tag_end - 1:tag_end] == b'/':
+                continue  # <svg ... /> 처럼 스스로 닫힌 태그
+
+            # </name 뒤에 공백 또는 '>'가 오는 닫는 태그 탐색
+            closing = b'</' + name
+            close = lower.find(closing, tag_end + 1)
+            while close >= 0 and lower[close + len(closing):close + len(closing) + 1] not in (
+                b'>', b' ', b'\t', b'\n', b'\r', b'\f'
+            ):
+                close = lower.find(closing, close + len(closing))
+            if close < 0:
+                unclosed.add(name)
+                continue
+            end = lower.find(b'>', close + len(closing))
+            if end < 0:
+                unclosed.add(name)
+                continue
+            end += 1
+
+        parts.append(markup[cursor:start])
+        cursor = end
+
+    if not parts:
+        return markup
+    parts.append(markup[cursor:])
+    return b''.join(parts)
+
+
+def _accept_encoding() -> str:
+    """요청할 압축 방식 (brotli 디코더가 설치된 경우에만 br 포함)"""
+    if find_spec('brotli') or find_spec('brotlicffi'):
+        return 'gzip, deflate, br'
+    return 'gzip, deflate'
+
+
+def _contains_any(*keywords: str) -> Callable[[Optional[str]], bool]:
+    """
+    bs4 속성 필터 (대소문자 무시 부분 문자열 검사)
+
+    긴 class 문자열에서도 정규식처럼 위치마다 재시도하지 않고 한 번씩만 훑음
+    """
+    def match(value: Optional[str]) -> bool:
+        if not value:
+            return False
+        value = value.lower()
+        return any(keyword in value for keyword in keywords)
+    return match
+
+
+# 본문/키워드 탐색용 속성 필터
+_MATCH_CONTENT_ATTR = _contains_any('content', 'article', 'post', 'entry', 'body')
+_MATCH_TAG_CLASS = _contains_any('tag')
+_MATCH_KW_PROP = _contains_any('keywords', 'tag')
+
+
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """
+    모든 UrlCrawler 인스턴스가 공유하는 HTTP 세션
+
+    인스턴스가 새로 만들어져도 keep-alive 연결(TCP/TLS 핸드셰이크)을 재사용
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 크롤링 결과 캐시 (모든 UrlCrawler 인스턴스 공유)
+# 정규화 URL -> (저장 시각, 결과)
+_RESULT_CACHE: "OrderedDict[str, Tuple[float, CrawlResult]]" = OrderedDict()
+# 진행 중인 동일 URL 요청 (중복 요청 방지)
+_INFLIGHT: Dict[str, Future] = {}
+_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class CrawlResult:
@@ -36,16 +202,72 @@ class UrlCrawler:
     # 요청 타임아웃
     TIMEOUT = 10
 
+    # 응답 크기 제한 (본문은 5000자까지만 쓰므로 앞부분만 읽음)
+    MAX_BYTES = 2_000_000
+    MAX_CONTENT_LENGTH = 5_000_000
+
+    # meta charset 선언을 찾을 문서 앞부분 크기
+    CHARSET_PEEK_BYTES = 2048
+
+    # 파싱할 Content-Type
+    HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+    # crawl_multiple 동시 요청 수
+    MAX_WORKERS = 8
+
+    # crawl_multiple에서 파싱을 프로세스 풀로 넘기는 최소 URL 수
+    # (프로세스 시작 비용이 있으므로 적은 수는 스레드에서 파싱)
+    PROCESS_POOL_MIN_URLS = 8
+
+    # 크롤링 결과 캐시 (성공 결과만, LRU + TTL)
+    CACHE_MAX_SIZE = 256
+    CACHE_TTL = 600  # 초
+
     # User-Agent (봇 차단 우회)
     HEADERS = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': _accept_encoding(),
     }
 
     # 제거할 태그들
     REMOVE_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']
 
+    # 본문 영역 찾기 (우선순위)
+    CONTENT_SELECTORS = [
+        # 네이버 블로그
+        ('div', {'class': 'se-main-container'}),
+        ('div', {'id': 'postViewArea'}),
+        ('div', {'class': 'post-view'}),
+        # 일반 블로그/뉴스
+        ('article', {}),
+        ('div', {'class': _MATCH_CONTENT_ATTR}),
+        ('div', {'id': _MATCH_CONTENT_ATTR}),
+        ('main', {}),
+    ]
+
+    # 문서에 하나만 있는 본문 태그 (find로 첫 번째만 확인)
+    UNIQUE_CONTENT_TAGS = ('main',)
+
+    # 이보다 긴 본문 후보를 찾으면 나머지 선택자는 확인하지 않음
+    CONTENT_ENOUGH_LENGTH = 1500
+
+    # 본문 영역이 없을 때 body에서 가져올 최대 문자열 수
+    FALLBACK_MAX_STRINGS = 2000
+
+    # 본문을 바로 가져올 JSON-LD 타입
+    JSON_LD_TYPES = ('Article', 'NewsArticle', 'BlogPosting')
+
+    # 최대 키워드 수
+    MAX_KEYWORDS = 10
+
+    # 태그 클래스 선택자
+    TAG_SELECTORS = [
+        ('a', {'class': _MATCH_TAG_CLASS}),
+        ('span', {'class': _MATCH_TAG_CLASS}),
+    ]
+
     def __init__(self, logger: Optional[Callable] = None):
         """
         Args:
@@ -53,112 +275,464 @@ class UrlCrawler:
         """
         self.logger = logger or print
 
+        # 프로세스 전역 세션 (연결 풀 공유 + 일시적 오류 재시도)
+        self._session = _shared_session()
+
+        # 프로세스 전역 결과 캐시 (URL마다 새 인스턴스를 만들어도 유지)
+        self._cache = _RESULT_CACHE
+        self._inflight = _INFLIGHT
+        self._cache_lock = _CACHE_LOCK
+
     def crawl(self, url: str) -> CrawlResult:
         """
         URL에서 내용 추출
 
+        최근 성공한 결과는 캐시에서 반환하고, 같은 URL을 동시에 요청하면
+        먼저 시작한 요청의 결과를 공유함
+
         Args:
             url: 크롤링할 URL
 
         Returns:
             CrawlResult 객체
         """
+        key = self._cache_key(url)
+        cached = self._cache_get(key)
+        if cached:
+            return cached
+
+        with self._cache_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = self._crawl_uncached(url)
+            if result.success:
+                self._cache_put(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+
+    def _crawl_uncached(self, url: str) -> CrawlResult:
+        """HTTP 요청 후 내용 추출 (캐시 미사용)"""
+        try:
+            markup, from_encoding = self._fetch(url)
+            return self._parse_result(url, markup, from_encoding)
+        except Exception as e:
+            return self._exception_result(url, e)
+
+    def _parse_safely(
+        self,
+        url: str,
+        markup: bytes,
+        from_encoding: Optional[str] = None
+    ) -> CrawlResult:
+        """현재 스레드에서 파싱 (예외는 실패 결과로 변환)"""
+        try:
+            return self._parse_result(url, markup, from_encoding)
+        except Exception as e:
+            return self._exception_result(url, e)
+
+    def _fetch(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        HTTP 요청 후 HTML 바이트와 인코딩 반환
+
+        Raises:
+            UrlCrawlerError: 유효하지 않은 URL, HTML이 아니거나 너무 큰 응답
+            requests.exceptions.RequestException: 요청 실패
+        """
+        # URL 유효성 검사
+        if not _RE_URL.match(url):
+            raise UrlCrawlerError("유효하지 않은 URL입니다.")
+
+        self.logger(f"URL 크롤링 중: {url}")
+
+        # HTTP 요청 (본문은 스트리밍으로 최대 MAX_BYTES까지만 읽음)
+        response = self._session.get(
+            url,
+            headers=self.HEADERS,
+            timeout=self.TIMEOUT,
+            allow_redirects=True,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+
+            error = self._check_response(
+                response.headers.get('Content-Type'),
+                response.headers.get('Content-Length')
+            )
+            if error:
+                raise UrlCrawlerError(error)
+
+            markup = response.raw.read(self.MAX_BYTES + 1, decode_content=True)
+            if len(markup) > self.MAX_BYTES:
+                self.logger(f"응답이 커서 앞부분만 사용: {url}")
+                markup = markup[:self.MAX_BYTES]
+
+            # 인코딩 처리 (헤더에 charset이 있을 때만 지정, 없으면 파서가 감지)
+            from_encoding = None
+            if response.encoding and response.encoding != 'ISO-8859-1':
+                from_encoding = response.encoding
+
+        return markup, from_encoding
+
+    def _exception_result(self, url: str, error: Exception) -> CrawlResult:
+        """요청/파싱 중 발생한 예외를 실패 결과로 변환"""
+        if isinstance(error, UrlCrawlerError):
+            return self._error_result(url, str(error))
+
+        if isinstance(error, requests.exceptions.Timeout):
+            return self._error_result(url, "요청 시간이 초과되었습니다.")
+
+        if isinstance(error, requests.exceptions.RequestException):
+            return self._error_result(url, f"URL 요청 실패: {str(error)[:100]}")
+
+        return self._error_result(url, f"크롤링 오류: {str(error)[:100]}")
+
+    async def crawl_async(self, url: str, session=None) -> CrawlResult:
+        """
+        URL에서 내용 추출 (비동기, aiohttp 필요)
+
+        HTML 파싱은 CPU 작업이므로 기본 executor에서 실행
+
+        Args:
+            url: 크롤링할 URL
+            session: 공유할 aiohttp.ClientSession (없으면 새로 생성)
+
+        Returns:
+            CrawlResult 객체
+        """
+        aiohttp = self._import_aiohttp()
+
+        key = self._cache_key(url)
+        cached = self._cache_get(key)
+        if cached:
+            return cached
+
+        if session is None:
+            async with self._create_async_session(aiohttp) as own_session:
+                return await self.crawl_async(url, own_session)
+
         try:
             # URL 유효성 검사
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                return CrawlResult(
-                    url=url,
-                    title="",
-                    content="",
-                    summary="",
-                    keywords=[],
-                    success=False,
-                    error_message="유효하지 않은 URL입니다."
-                )
+            if not _RE_URL.match(url):
+                return self._error_result(url, "유효하지 않은 URL입니다.")
 
             self.logger(f"URL 크롤링 중: {url}")
 
-            # HTTP 요청
-            response = requests.get(
+            async with session.get(
                 url,
                 headers=self.HEADERS,
-                timeout=self.TIMEOUT,
-                allow_redirects=True
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+
+                error = self._check_response(
+                    response.headers.get('Content-Type'),
+                    response.headers.get('Content-Length')
+                )
+                if error:
+                    return self._error_result(url, error)
+
+                markup = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    markup += chunk
+                    if len(markup) > self.MAX_BYTES:
+                        self.logger(f"응답이 커서 앞부분만 사용: {url}")
+                        del markup[self.MAX_BYTES:]
+                        break
+                markup = bytes(markup)
+                from_encoding = response.charset
+
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, self._parse_result, url, markup, from_encoding
             )
-            response.raise_for_status()
+            self._cache_put(key, result)
+            return result
 
-            # 인코딩 처리
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding
+        except asyncio.TimeoutError:
+            return self._error_result(url, "요청 시간이 초과되었습니다.")
 
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
+        except aiohttp.ClientError as e:
+            return self._error_result(url, f"URL 요청 실패: {str(e)[:100]}")
 
-            # 제목 추출
-            title = self._extract_title(soup)
+        except Exception as e:
+            return self._error_result(url, f"크롤링 오류: {str(e)[:100]}")
 
-            # 본문 추출
-            content = self._extract_content(soup)
+    async def crawl_multiple_async(self, urls: List[str]) -> List[CrawlResult]:
+        """
+        여러 URL 동시 크롤링 (비동기, aiohttp 필요)
+
+        Args:
+            urls: URL 리스트
 
-            # 요약 생성
-            summary = self._generate_summary(content)
+        Returns:
+            CrawlResult 리스트 (입력 순서 유지)
+        """
+        aiohttp = self._import_aiohttp()
+
+        async with self._create_async_session(aiohttp) as session:
+            return list(await asyncio.gather(
+                *[self.crawl_async(url, session) for url in urls]
+            ))
+
+    def _check_response(
+        self,
+        content_type: Optional[str],
+        content_length: Optional[str]
+    ) -> Optional[str]:
+        """응답 헤더 검사 (문제가 있으면 오류 메시지 반환)"""
+        if content_type:
+            mime = content_type.split(';', 1)[0].strip().lower()
+            if mime not in self.HTML_CONTENT_TYPES:
+                return f"HTML 문서가 아닙니다: {mime}"
+
+        if content_length and content_length.isdigit():
+            if int(content_length) > self.MAX_CONTENT_LENGTH:
+                return "응답 크기 초과"
+
+        return None
+
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """캐시 키용 URL 정규화 (scheme/host 소문자, fragment 제거)"""
+        try:
+            parts = urlsplit(url.strip())
+        except ValueError:
+            return url
+        return urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, "")
+        )
+
+    def _cache_get(self, key: str) -> Optional[CrawlResult]:
+        """유효한 캐시 결과 조회"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= self.CACHE_TTL:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: str, result: CrawlResult):
+        """결과 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _import_aiohttp():
+        """aiohttp 지연 import"""
+        try:
+            import aiohttp
+        except ImportError:
+            raise UrlCrawlerError("aiohttp 패키지가 필요합니다.")
+        return aiohttp
+
+    @staticmethod
+    def _create_async_session(aiohttp):
+        """호스트별 연결 수 제한과 DNS 캐시를 적용한 aiohttp 세션"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300)
+        )
+
+    def _parse_result(
+        self,
+        url: str,
+        markup: bytes,
+        from_encoding: Optional[str] = None
+    ) -> CrawlResult:
+        """HTML 본문에서 제목/본문/요약/키워드 추출"""
+        # 헤더에 charset이 없으면 직접 판별 (전체 문서 통계 분석 회피)
+        if not from_encoding:
+            from_encoding = self._sniff_encoding(markup)
+
+        # 구조화 데이터(JSON-LD)에 본문이 있으면 HTML 탐색 생략
+        article = self._find_json_ld_article(markup, from_encoding)
+        if article:
+            return self._json_ld_result(url, article)
+
+        # HTML 파싱
+        soup = self._parse_html(markup, from_encoding)
+
+        # 제목 추출
+        title = self._extract_title(soup)
+
+        # 본문 추출
+        content = self._extract_content(soup)
+
+        # 요약 생성
+        summary = self._generate_summary(content)
+
+        # 키워드 추출
+        keywords = self._extract_keywords(soup, content)
+
+        self.logger(f"크롤링 완료: {title[:50]}...")
+
+        return CrawlResult(
+            url=url,
+            title=title,
+            content=content,
+            summary=summary,
+            keywords=keywords,
+            success=True
+        )
+
+    def _find_json_ld_article(
+        self,
+        markup: bytes,
+        encoding: Optional[str] = None
+    ) -> Optional[dict]:
+        """JSON-LD에서 제목과 본문이 있는 Article 계열 항목 찾기"""
+        for match in _RE_JSON_LD.finditer(markup):
+            # 인코딩을 확정할 수 없으면 HTML 경로(파서 자동 감지)로 넘김
+            try:
+                data = _json_loads(match.group(1).decode(encoding or 'utf-8'))
+            except (LookupError, ValueError):
+                continue
+
+            for item in self._iter_json_ld(data):
+                headline = item.get('headline')
+                body = item.get('articleBody')
+                if (isinstance(headline, str) and headline.strip()
+                        and isinstance(body, str) and len(body) >= 100):
+                    return item
+
+        return None
+
+    def _iter_json_ld(self, data):
+        """JSON-LD 항목 순회 (리스트, @graph 포함)"""
+        if isinstance(data, list):
+            for item in data:
+                yield from self._iter_json_ld(item)
+        elif isinstance(data, dict):
+            if '@graph' in data:
+                yield from self._iter_json_ld(data['@graph'])
+
+            types = data.get('@type')
+            if not isinstance(types, list):
+                types = [types]
+            if any(t in self.JSON_LD_TYPES for t in types):
+                yield data
+
+    def _json_ld_result(self, url: str, article: dict) -> CrawlResult:
+        """JSON-LD Article 항목으로 결과 생성"""
+        title = html.unescape(article['headline']).strip()
+        content = self._clean_text(html.unescape(article['articleBody']))
+        summary = self._generate_summary(content)
+
+        keywords = article.get('keywords') or []
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        elif not isinstance(keywords, list):
+            keywords = []
+        keywords = self._normalize_keywords(
+            [html.unescape(str(k)).strip() for k in keywords]
+        )
+
+        self.logger(f"크롤링 완료: {title[:50]}...")
+
+        return CrawlResult(
+            url=url,
+            title=title,
+            content=content,
+            summary=summary,
+            keywords=keywords,
+            success=True
+        )
+
+    @staticmethod
+    def _error_result(url: str, message: str) -> CrawlResult:
+        """실패 결과 생성"""
+        return CrawlResult(
+            url=url,
+            title="",
+            content="",
+            summary="",
+            keywords=[],
+            success=False,
+            error_message=message
+        )
+
+    def _parse_html(self, markup: bytes, from_encoding: Optional[str] = None) -> BeautifulSoup:
+        """HTML 파싱 (lxml 사용, 미설치 시 html.parser)"""
+        # 쓰지 않는 script/style/주석은 노드를 만들기 전에 제거
+        markup = _strip_junk_blocks(markup)
 
-            # 키워드 추출
-            keywords = self._extract_keywords(soup, content)
+        try:
+            return BeautifulSoup(markup, 'lxml', from_encoding=from_encoding)
+        except FeatureNotFound:
+            return BeautifulSoup(markup, 'html.parser', from_encoding=from_encoding)
 
-            self.logger(f"크롤링 완료: {title[:50]}...")
+    def _sniff_encoding(self, markup: bytes) -> Optional[str]:
+        """
+        인코딩 판별 (앞부분 meta charset > UTF-8 검사)
 
-            return CrawlResult(
-                url=url,
-                title=title,
-                content=content,
-                summary=summary,
-                keywords=keywords,
-                success=True
-            )
+        둘 다 실패하면 None을 반환하여 파서의 자동 감지에 맡김
+        """
+        match = _RE_META_CHARSET.search(markup, 0, self.CHARSET_PEEK_BYTES)
+        if match:
+            return match.group(1).decode('ascii')
 
-        except requests.exceptions.Timeout:
-            return CrawlResult(
-                url=url,
-                title="",
-                content="",
-                summary="",
-                keywords=[],
-                success=False,
-                error_message="요청 시간이 초과되었습니다."
-            )
+        # 잘린 응답의 마지막 글자가 깨져 있어도 UTF-8로 인정
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(markup)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return None
 
-        except requests.exceptions.RequestException as e:
-            return CrawlResult(
-                url=url,
-                title="",
-                content="",
-                summary="",
-                keywords=[],
-                success=False,
-                error_message=f"URL 요청 실패: {str(e)[:100]}"
-            )
+    @staticmethod
+    def _find_in_head(soup: BeautifulSoup, *args, **kwargs):
+        """
+        <head>에서 먼저 찾고, 없으면 문서 전체에서 찾기
 
-        except Exception as e:
-            return CrawlResult(
-                url=url,
-                title="",
-                content="",
-                summary="",
-                keywords=[],
-                success=False,
-                error_message=f"크롤링 오류: {str(e)[:100]}"
-            )
+        head 안에 div/img 등이 있으면 파서가 head를 일찍 닫아
+        나머지 meta가 body로 옮겨지므로 전체 문서도 확인
+        """
+        head = soup.head
+        if head is not None:
+            found = head.find(*args, **kwargs)
+            if found is not None:
+                return found
+        return soup.find(*args, **kwargs)
+
+    @staticmethod
+    def _find_all_in_head(soup: BeautifulSoup, *args, **kwargs) -> list:
+        """<head>에서 먼저 모두 찾고, 없으면 문서 전체에서 찾기"""
+        head = soup.head
+        if head is not None:
+            found = head.find_all(*args, **kwargs)
+            if found:
+                return found
+        return soup.find_all(*args, **kwargs)
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """제목 추출"""
         # 우선순위: og:title > title > h1
-        og_title = soup.find('meta', property='og:title')
+        # meta/title은 보통 <head>에 있으므로 head부터 탐색
+        og_title = self._find_in_head(soup, 'meta', property='og:title')
         if og_title and og_title.get('content'):
             return og_title['content'].strip()
 
-        title_tag = soup.find('title')
+        title_tag = self._find_in_head(soup, 'title')
         if title_tag and title_tag.string:
             return title_tag.string.strip()
 
@@ -174,100 +748,138 @@ class UrlCrawler:
         for tag in soup.find_all(self.REMOVE_TAGS):
             tag.decompose()
 
-        # 본문 영역 찾기 (우선순위)
-        content_selectors = [
-            # 네이버 블로그
-            ('div', {'class': 'se-main-container'}),
-            ('div', {'id': 'postViewArea'}),
-            ('div', {'class': 'post-view'}),
-            # 일반 블로그/뉴스
-            ('article', {}),
-            ('div', {'class': re.compile(r'(content|article|post|entry|body)', re.I)}),
-            ('div', {'id': re.compile(r'(content|article|post|entry|body)', re.I)}),
-            ('main', {}),
-        ]
+        # 후보는 텍스트 길이만 세고, 가장 긴 요소에서만 텍스트를 만듦
+        best_elem = None
+        best_len = 0
 
-        content_text = ""
+        for elem in self._iter_content_candidates(soup):
+            text_len = self._text_length(elem, self.CONTENT_ENOUGH_LENGTH)
+            if text_len > best_len:
+                best_elem = elem
+                best_len = text_len
+                if best_len > self.CONTENT_ENOUGH_LENGTH:
+                    break
 
-        for tag_name, attrs in content_selectors:
-            elements = soup.find_all(tag_name, attrs)
-            for elem in elements:
-                text = elem.get_text(separator='\n', strip=True)
-                if len(text) > len(content_text):
-                    content_text = text
+        content_text = ""
+        if best_elem is not None:
+            content_text = best_elem.get_text(separator='\n', strip=True)
 
-        # 본문을 찾지 못한 경우 body 전체 텍스트
-        if not content_text or len(content_text) < 100:
+        # 본문을 찾지 못한 경우 body 텍스트 (앞부분만 읽고 중단)
+        if len(content_text) < 100:
             body = soup.find('body')
             if body:
-                content_text = body.get_text(separator='\n', strip=True)
+                content_text = '\n'.join(
+                    islice(body.stripped_strings, self.FALLBACK_MAX_STRINGS)
+                )
 
         # 정리
         content_text = self._clean_text(content_text)
 
         return content_text
 
-    def _clean_text(self, text: str) -> str:
-        """텍스트 정리"""
-        # 연속 공백/줄바꿈 정리
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
-        text = re.sub(r'\t+', ' ', text)
+    def _iter_content_candidates(self, soup: BeautifulSoup):
+        """본문 후보 요소 (선택자 우선순위 순, 필요한 만큼만 탐색)"""
+        for tag_name, attrs in self.CONTENT_SELECTORS:
+            # 문서에 하나뿐인 태그(main)는 첫 번째 요소만 확인
+            # (article은 목록/관련글 카드에도 쓰이므로 모두 확인)
+            if tag_name in self.UNIQUE_CONTENT_TAGS and not attrs:
+                elem = soup.find(tag_name)
+                if elem:
+                    yield elem
+            else:
+                yield from soup.find_all(tag_name, attrs)
+
+    @staticmethod
+    def _text_length(elem, limit: int) -> int:
+        """
+        get_text(separator='\\n', strip=True) 결과 길이 (문자열을 만들지 않고 계산)
+
+        limit을 넘으면 그 시점까지의 길이를 반환
+        """
+        length = -1
+        for text in elem.stripped_strings:
+            length += len(text) + 1
+            if length > limit:
+                break
+        return max(length, 0)
+
+    def _clean_text(self, text: str, max_length: int = 5000) -> str:
+        """텍스트 정리 (공백 축소, 빈 줄 제거, 최대 길이 제한)"""
+        # 줄 단위로 한 번만 훑고, 최대 길이를 넘으면 나머지 줄은 처리하지 않음
+        lines = []
+        length = -1
+        for line in io.StringIO(text):
+            line = _RE_HSPACE.sub(' ', line).strip()
+            if not line:
+                continue
+            lines.append(line)
+            length += len(line) + 1
+            if length > max_length:
+                break
 
-        # 빈 줄 정리
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
         text = '\n'.join(lines)
 
         # 최대 길이 제한 (5000자)
-        if len(text) > 5000:
-            text = text[:5000] + "..."
+        if len(text) > max_length:
+            text = text[:max_length] + "..."
 
         return text
 
     def _generate_summary(self, content: str, max_length: int = 300) -> str:
         """요약 생성"""
-        # 첫 몇 문장 추출
-        sentences = re.split(r'[.!?]\s+', content)
+        # 첫 몇 문장 추출 (전체를 나누지 않고 앞에서부터 필요한 만큼만 탐색)
         summary = ""
+        pos = 0
 
-        for sentence in sentences:
+        while True:
+            match = _RE_SENT.search(content, pos)
+            end = match.start() if match else len(content)
+            sentence = content[pos:end]
             if len(summary) + len(sentence) > max_length:
                 break
             summary += sentence + ". "
+            if not match:
+                break
+            pos = match.end()
 
         return summary.strip()
 
     def _extract_keywords(self, soup: BeautifulSoup, content: str) -> List[str]:
         """키워드 추출"""
-        keywords = []
+        return self._normalize_keywords(self._iter_keyword_candidates(soup))
 
+    def _iter_keyword_candidates(self, soup: BeautifulSoup) -> Iterator[str]:
+        """키워드 후보 (우선순위 순, 필요한 만큼만 탐색)"""
         # meta keywords
-        meta_keywords = soup.find('meta', {'name': 'keywords'})
+        meta_keywords = self._find_in_head(soup, 'meta', {'name': 'keywords'})
         if meta_keywords and meta_keywords.get('content'):
-            keywords.extend([k.strip() for k in meta_keywords['content'].split(',')])
+            for k in meta_keywords['content'].split(','):
+                yield k.strip()
 
         # og:keywords 또는 article:tag
-        for meta in soup.find_all('meta', property=re.compile(r'(keywords|tag)', re.I)):
+        for meta in self._find_all_in_head(soup, 'meta', property=_MATCH_KW_PROP):
             if meta.get('content'):
-                keywords.extend([k.strip() for k in meta['content'].split(',')])
+                for k in meta['content'].split(','):
+                    yield k.strip()
 
         # 태그 클래스에서 추출
-        tag_selectors = [
-            ('a', {'class': re.compile(r'tag', re.I)}),
-            ('span', {'class': re.compile(r'tag', re.I)}),
-        ]
-
-        for tag_name, attrs in tag_selectors:
+        for tag_name, attrs in self.TAG_SELECTORS:
             for elem in soup.find_all(tag_name, attrs):
                 tag_text = elem.get_text(strip=True)
                 if tag_text and len(tag_text) < 30:
-                    keywords.append(tag_text.replace('#', ''))
+                    yield tag_text.replace('#', '')
 
-        # 중복 제거 및 정리
-        keywords = list(dict.fromkeys(keywords))  # 순서 유지하며 중복 제거
-        keywords = [k for k in keywords if k and len(k) > 1]
+    def _normalize_keywords(self, keywords: Iterable[str]) -> List[str]:
+        """키워드 중복 제거 및 정리 (최대 개수가 차면 나머지 후보는 확인하지 않음)"""
+        result: Dict[str, None] = {}  # 순서 유지하며 중복 제거
 
-        return keywords[:10]  # 최대 10개
+        for keyword in keywords:
+            if keyword and len(keyword) > 1:
+                result[keyword] = None
+                if len(result) >= self.MAX_KEYWORDS:
+                    break
+
+        return list(result)
 
     def crawl_multiple(self, urls: List[str]) -> List[CrawlResult]:
         """
@@ -279,12 +891,107 @@ class UrlCrawler:
         Returns:
             CrawlResult 리스트
         """
-        results = []
+        if not urls:
+            return []
+
+        if len(urls) >= self.PROCESS_POOL_MIN_URLS:
+            return self._crawl_multiple_processes(urls)
+
+        # 네트워크 대기 위주이므로 스레드로 병렬 요청 (입력 순서 유지)
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(urls))) as executor:
+            return list(executor.map(self.crawl, urls))
+
+    def _crawl_multiple_processes(self, urls: List[str]) -> List[CrawlResult]:
+        """
+        요청은 스레드 풀, HTML 파싱은 프로세스 풀에서 실행 (GIL 회피)
+
+        Returns:
+            CrawlResult 리스트 (입력 순서 유지)
+        """
+        results: Dict[str, CrawlResult] = {}
+        pending: Dict[str, str] = {}  # 캐시 키 -> URL (중복 URL은 한 번만 요청)
+
         for url in urls:
-            result = self.crawl(url)
-            results.append(result)
+            key = self._cache_key(url)
+            if key in results or key in pending:
+                continue
+            cached = self._cache_get(key)
+            if cached:
+                results[key] = cached
+            else:
+                pending[key] = url
+
+        if pending:
+            workers = min(self.MAX_WORKERS, len(pending))
+            # fork는 requests/ssl 상태를 복제하므로 spawn 사용
+            context = multiprocessing.get_context('spawn')
+
+            with ThreadPoolExecutor(max_workers=workers) as fetch_executor:
+                with ProcessPoolExecutor(
+                    max_workers=min(os.cpu_count() or 1, workers),
+                    mp_context=context
+                ) as parse_executor:
+                    fetching = {
+                        fetch_executor.submit(self._fetch, url): key
+                        for key, url in pending.items()
+                    }
+                    parsing = {}  # 파싱 Future -> (캐시 키, HTML, 인코딩)
+                    pool_broken = False
+
+                    def store(key: str, result: CrawlResult):
+                        if result.success:
+                            self._cache_put(key, result)
+                            self.logger(f"크롤링 완료: {result.title[:50]}...")
+                        results[key] = result
+
+                    # 받은 순서대로 파싱 시작
+                    for future in as_completed(fetching):
+                        key = fetching[future]
+                        try:
+                            markup, from_encoding = future.result()
+                        except Exception as e:
+                            results[key] = self._exception_result(pending[key], e)
+                            continue
+
+                        if not pool_broken:
+                            try:
+                                parse_future = parse_executor.submit(
+                                    _parse_in_process, type(self), pending[key], markup, from_encoding
+                                )
+                                parsing[parse_future] = (key, markup, from_encoding)
+                                continue
+                            except Exception as e:
+                                # 워커 비정상 종료(BrokenProcessPool) 등: 남은 페이지는 현재 스레드에서 파싱
+                                self.logger(f"프로세스 풀 사용 불가, 현재 스레드에서 파싱: {e}")
+                                pool_broken = True
+
+                        store(key, self._parse_safely(pending[key], markup, from_encoding))
+
+                    for future in as_completed(parsing):
+                        key, markup, from_encoding = parsing[future]
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            result = self._parse_safely(pending[key], markup, from_encoding)
+                        except Exception as e:
+                            result = self._exception_result(pending[key], e)
+                        store(key, result)
+
+        return [results[self._cache_key(url)] for url in urls]
+
+    def close(self):
+        """
+        리소스 정리
+
+        HTTP 세션과 결과 캐시는 다른 인스턴스와 공유하므로 유지
+        (만료 항목은 CACHE_TTL/CACHE_MAX_SIZE에 따라 자동 정리)
+        """
 
-        return results
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 class UrlCrawlerError(Exception):
@@ -292,6 +999,17 @@ class UrlCrawlerError(Exception):
     pass
 
 
+def _parse_in_process(
+    crawler_cls: type,
+    url: str,
+    markup: bytes,
+    from_encoding: Optional[str]
+) -> CrawlResult:
+    """프로세스 풀 작업용 파싱 함수 (로그는 부모 프로세스에서 출력)"""
+    crawler = crawler_cls(logger=lambda message: None)
+    return crawler._parse_result(url, markup, from_encoding)
+
+
 # 독립 실행 테스트
 if __name__ == "__main__":
     print("=== UrlCrawler 모듈 테스트 ===\n")
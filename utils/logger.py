@@ -2,6 +2,7 @@
 로거 유틸리티 - GUI 로그 출력
 """
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,19 +12,49 @@ if TYPE_CHECKING:
 class Logger:
     """GUI 로그 출력 클래스"""
 
+    # 쌓인 로그를 GUI에 반영하는 주기 (ms)
+    FLUSH_INTERVAL = 50
+
     def __init__(self, app: 'NaverBlogPosterApp'):
         self.app = app
 
+        # 아직 GUI에 반영되지 않은 (메시지, 레벨)
+        self._queue = deque()
+        self._pending = False
+
     def log(self, message: str, level: str = "info"):
-        """로그 출력 (메인 스레드에서 실행)"""
-        # GUI 업데이트는 메인 스레드에서 해야 함
-        self.app.after(0, lambda: self._log_to_gui(message, level))
+        """로그 출력 (메인 스레드에서 모아서 실행)"""
+        self._queue.append((message, level))
+
+        # GUI 업데이트는 메인 스레드에서 해야 함 (예약된 반영이 없을 때만 예약)
+        if not self._pending:
+            self._pending = True
+            self.app.after(self.FLUSH_INTERVAL, self._drain)
 
     def __call__(self, message: str, level: str = "info"):
         """함수처럼 호출 가능하게 지원"""
         self.log(message, level)
 
-    def _log_to_gui(self, message: str, level: str):
+    def _drain(self):
+        """쌓인 로그를 한 번에 GUI에 출력"""
+        # 먼저 플래그를 내려야 비우는 도중 들어온 로그도 다음 반영이 예약됨
+        self._pending = False
+
+        items = []
+        while self._queue:
+            items.append(self._queue.popleft())
+
+        if items:
+            self._log_to_gui(items)
+
+    def _log_to_gui(self, items: list):
         """GUI에 로그 출력"""
-        if hasattr(self.app, 'log_frame'):
-            self.app.log_frame.add_log(message, level)
+        if not hasattr(self.app, 'log_frame'):
+            return
+
+        log_frame = self.app.log_frame
+        if hasattr(log_frame, 'add_log_batch'):
+            log_frame.add_log_batch(items)
+        else:
+            for message, level in items:
+                log_frame.add_log(message, level)